@@ -0,0 +1,141 @@
+"""
+Compare the Bloom classifier backends (random forest vs linear head) on
+model load time, memory, batch latency and accuracy.
+
+Usage:
+    python benchmark_bloom.py --data labelled_holdout.csv
+
+Run it on the held-out CSV written by export_bloom_head.py so neither
+backend is scored on paragraphs it was trained on.
+
+Paragraphs are embedded once; each backend is then measured in a fresh
+subprocess so load time and RSS are not skewed by the other model.
+Accuracy is reported when the CSV has a level column (as agreement with
+the distillation labels when --distilled is given), and agreement with the
+random forest is always reported.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from bloom_predictor import DEFAULT_MODEL_PATHS
+
+BACKENDS = ("rf", "linear")
+
+
+def current_rss_mb():
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_worker(backend, model_path, embeddings_path, repeats):
+    from bloom_predictor import load_classifier
+
+    embeddings = np.load(embeddings_path)
+    rss_before = current_rss_mb()
+    start = time.perf_counter()
+    classifier = load_classifier(backend, model_path)
+    load_seconds = time.perf_counter() - start
+    rss_after = current_rss_mb()
+
+    classifier.predict_proba(embeddings[:1])  # warm up
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        probabilities = classifier.predict_proba(embeddings)
+        timings.append(time.perf_counter() - start)
+    predictions = classifier.classes_[np.argmax(probabilities, axis=1)]
+
+    print(json.dumps({
+        "backend": backend,
+        "load_ms": load_seconds * 1000,
+        "rss_mb": rss_after - rss_before,
+        "batch_ms": float(np.median(timings)) * 1000,
+        "predictions": predictions.tolist(),
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--data", required=True, help="CSV file with paragraphs to classify")
+    parser.add_argument("--text-column", default="text")
+    parser.add_argument("--label-column", default="level")
+    parser.add_argument("--distilled", action="store_true",
+                        help="Labels were produced by the random forest (export_bloom_head.py --distill)")
+    parser.add_argument("--rf-model", default=DEFAULT_MODEL_PATHS["rf"])
+    parser.add_argument("--linear-model", default=DEFAULT_MODEL_PATHS["linear"])
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--worker", choices=BACKENDS, help=argparse.SUPPRESS)
+    parser.add_argument("--embeddings", help=argparse.SUPPRESS)
+    parser.add_argument("--model", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.worker, args.model, args.embeddings, args.repeats)
+        return
+
+    model_paths = {"rf": args.rf_model, "linear": args.linear_model}
+
+    from export_bloom_head import parse_levels, read_dataset
+
+    texts, labels, rows = read_dataset(args.data, args.text_column, args.label_column)
+    if not texts:
+        raise SystemExit(f"No rows with a '{args.text_column}' column found in {args.data}")
+    has_labels = all(label not in (None, "") for label in labels)
+    if has_labels:
+        levels = parse_levels(labels, rows, args.data, args.label_column)
+
+    from sentence_transformers import SentenceTransformer
+    embedder = SentenceTransformer('all-mpnet-base-v2')
+    embeddings = embedder.encode(texts, batch_size=64)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        embeddings_path = os.path.join(tmp, "embeddings.npy")
+        np.save(embeddings_path, embeddings)
+        for backend in BACKENDS:
+            worker = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--data", args.data,
+                 "--worker", backend, "--model", os.path.abspath(model_paths[backend]),
+                 "--embeddings", embeddings_path, "--repeats", str(args.repeats)],
+                capture_output=True, text=True,
+                cwd=os.path.dirname(os.path.abspath(__file__)),
+            )
+            if worker.returncode != 0:
+                sys.stderr.write(worker.stderr)
+                raise SystemExit(f"Benchmark worker for '{backend}' failed with exit status {worker.returncode}")
+            results[backend] = json.loads(worker.stdout.strip().splitlines()[-1])
+
+    rf_predictions = np.array(results["rf"]["predictions"])
+    print(f"{len(texts)} paragraphs, median of {args.repeats} runs")
+    header = f"{'backend':<8} {'load ms':>10} {'RSS MB':>10} {'batch ms':>10} {'agree rf':>10}"
+    if has_labels:
+        header += f" {'agree lbl' if args.distilled else 'accuracy':>10}"
+    print(header)
+    for backend in BACKENDS:
+        result = results[backend]
+        predictions = np.array(result["predictions"])
+        line = (f"{backend:<8} {result['load_ms']:>10.1f} {result['rss_mb']:>10.1f} "
+                f"{result['batch_ms']:>10.3f} {np.mean(predictions == rf_predictions):>10.4f}")
+        if has_labels:
+            accuracy = np.mean(predictions == levels)
+            line += f" {accuracy:>10.4f}"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,81 @@
 import os
 import json
-import joblib
-from sentence_transformers import SentenceTransformer
 import numpy as np
 
+MODELS_DIR = os.path.join(os.path.dirname(__file__), "models")
+DEFAULT_MODEL_PATHS = {
+    "rf": os.path.join(MODELS_DIR, "rf_model.pkl"),
+    "linear": os.path.join(MODELS_DIR, "bloom_linear.npz"),
+}
+# Levels of Bloom's taxonomy the service can generate questions for
+BLOOM_LEVELS = (1, 2, 3, 4, 5, 6)
+
+
+class LinearBloomHead:
+    """
+    Logistic-regression head stored as plain arrays.
+    Scores a whole embedding batch with one matrix multiply and exposes
+    the same predict / predict_proba / classes_ interface as the sklearn model.
+    """
+    def __init__(self, coef, intercept, classes):
+        self.coef_ = np.asarray(coef, dtype=np.float32)
+        self.intercept_ = np.asarray(intercept, dtype=np.float32)
+        self.classes_ = np.asarray(classes)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path, allow_pickle=False) as data:
+            return cls(data["coef"], data["intercept"], data["classes"])
+
+    def save(self, path):
+        # Write through a file handle so np.savez does not append ".npz" to the path
+        with open(path, "wb") as f:
+            np.savez(f, coef=self.coef_, intercept=self.intercept_, classes=self.classes_)
+
+    def predict_proba(self, embeddings):
+        scores = np.asarray(embeddings, dtype=np.float32) @ self.coef_.T + self.intercept_
+        if scores.shape[1] == 1:
+            # Binary logistic regression keeps a single row of weights
+            positive = 1.0 / (1.0 + np.exp(-scores[:, 0]))
+            return np.column_stack([1.0 - positive, positive])
+        scores -= scores.max(axis=1, keepdims=True)
+        np.exp(scores, out=scores)
+        scores /= scores.sum(axis=1, keepdims=True)
+        return scores
+
+    def predict(self, embeddings):
+        return self.classes_[np.argmax(self.predict_proba(embeddings), axis=1)]
+
+
+def validate_backend(backend):
+    if backend not in DEFAULT_MODEL_PATHS:
+        raise ValueError(
+            f"Unknown Bloom classifier backend: {backend} "
+            f"(expected one of {', '.join(DEFAULT_MODEL_PATHS)})"
+        )
+
+
+def load_classifier(backend, model_path=None):
+    """
+    Load the Bloom classifier for the given backend ("rf" or "linear").
+    """
+    validate_backend(backend)
+    if model_path is None:
+        model_path = DEFAULT_MODEL_PATHS[backend]
+    if backend == "linear":
+        return LinearBloomHead.load(model_path)
+    import joblib
+    return joblib.load(model_path)
+
+
 class BloomPredictor:
-    def __init__(self, model_path=None):
-        if model_path is None:
-            model_path = os.path.join(os.path.dirname(__file__), "models", "rf_model.pkl")
-        self.rf_model = joblib.load(model_path)
+    def __init__(self, model_path=None, backend=None):
+        if backend is None:
+            backend = os.getenv("BLOOM_BACKEND", "rf")
+        validate_backend(backend)
+        from sentence_transformers import SentenceTransformer
+        self.backend = backend
+        self.classifier = load_classifier(backend, model_path)
         self.embedder = SentenceTransformer('all-mpnet-base-v2')
 
     def predict_bloom_levels(self, paragraphs):
@@ -23,14 +90,39 @@ class BloomPredictor:
             return []
 
         embeddings = self.embedder.encode(paragraphs)
-        predictions = self.rf_model.predict(embeddings)
+        predictions = self.classifier.predict(embeddings)
         return predictions.tolist()
 
-# Singleton instance for reuse
-bloom_predictor = BloomPredictor()
+    def predict_bloom_probabilities(self, paragraphs):
+        """
+        Predict Bloom's taxonomy level probabilities for a list of paragraphs.
+        Args:
+            paragraphs (list of str): Paragraph texts.
+        Returns:
+            list of dict: Mapping of Bloom level to probability for each paragraph.
+        """
+        if not paragraphs:
+            return []
+
+        embeddings = self.embedder.encode(paragraphs)
+        probabilities = self.classifier.predict_proba(embeddings)
+        levels = self.classifier.classes_.tolist()
+        return [dict(zip(levels, row.tolist())) for row in probabilities]
+
+# Singleton instance for reuse, created on first use
+_bloom_predictor = None
+
+def get_bloom_predictor():
+    global _bloom_predictor
+    if _bloom_predictor is None:
+        _bloom_predictor = BloomPredictor()
+    return _bloom_predictor
 
 def predict_bloom_level_for_paragraph(paragraph):
-    return bloom_predictor.predict_bloom_levels([paragraph])[0]
+    return get_bloom_predictor().predict_bloom_levels([paragraph])[0]
+
+def predict_bloom_probabilities_for_paragraph(paragraph):
+    return get_bloom_predictor().predict_bloom_probabilities([paragraph])[0]
 
 if __name__ == "__main__":
     # Simple test
@@ -39,6 +131,8 @@ if __name__ == "__main__":
         "Explain how machine learning algorithms work.",
         "Design a system that can classify images."
     ]
+    bloom_predictor = get_bloom_predictor()
     predictions = bloom_predictor.predict_bloom_levels(test_paragraphs)
-    for para, pred in zip(test_paragraphs, predictions):
-        print(f"Paragraph: {para}\nPredicted Bloom Level: {pred}\n")
+    probabilities = bloom_predictor.predict_bloom_probabilities(test_paragraphs)
+    for para, pred, proba in zip(test_paragraphs, predictions, probabilities):
+        print(f"Paragraph: {para}\nPredicted Bloom Level: {pred}\nConfidence: {json.dumps(proba)}\n")
@@ -0,0 +1,140 @@
+"""
+Train a logistic-regression Bloom head on sentence embeddings and export it
+as plain arrays (models/bloom_linear.npz) for BloomPredictor(backend="linear").
+
+Usage:
+    python export_bloom_head.py --data labelled.csv
+    python export_bloom_head.py --data paragraphs.csv --distill
+
+The CSV needs a text column and, unless --distill is given, a Bloom level
+column. With --distill the current random forest labels the texts instead.
+The head is fitted on the training split only; the held-out split is written
+to --holdout-output so benchmark_bloom.py can score both backends on unseen
+paragraphs.
+"""
+import argparse
+import csv
+import os
+
+import numpy as np
+from sklearn.linear_model import LogisticRegression
+from sklearn.model_selection import train_test_split
+
+from bloom_predictor import BLOOM_LEVELS, DEFAULT_MODEL_PATHS, LinearBloomHead, load_classifier
+
+
+def read_dataset(path, text_column, label_column):
+    """
+    Read non-empty texts and their raw label values from a CSV file.
+    Returns texts, labels and the CSV line number of each row.
+    """
+    texts, labels, rows = [], [], []
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            text = (row.get(text_column) or "").strip()
+            if not text:
+                continue
+            texts.append(text)
+            labels.append(row.get(label_column))
+            rows.append(reader.line_num)
+    return texts, labels, rows
+
+
+def parse_levels(labels, rows, path, label_column):
+    """
+    Convert raw label values to integer Bloom levels ("3" and "3.0" are accepted).
+    Levels outside BLOOM_LEVELS are rejected.
+    """
+    levels = []
+    for label, row in zip(labels, rows):
+        try:
+            value = float((label or "").strip())
+        except ValueError:
+            value = None
+        if value is None or not value.is_integer() or int(value) not in BLOOM_LEVELS:
+            raise SystemExit(
+                f"{path}:{row}: '{label_column}' must be an integer Bloom level "
+                f"between {BLOOM_LEVELS[0]} and {BLOOM_LEVELS[-1]}, got {label!r}"
+            )
+        levels.append(int(value))
+    return np.array(levels)
+
+
+def write_holdout(path, texts, levels, label_column):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["text", label_column])
+        writer.writerows(zip(texts, levels.tolist()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--data", required=True, help="CSV file with training paragraphs")
+    parser.add_argument("--text-column", default="text")
+    parser.add_argument("--label-column", default="level")
+    parser.add_argument("--distill", action="store_true", help="Label texts with the random forest model")
+    parser.add_argument("--output", default=DEFAULT_MODEL_PATHS["linear"])
+    parser.add_argument("--holdout-output", help="CSV for the held-out split (default: <data>_holdout.csv)")
+    parser.add_argument("--test-size", type=float, default=0.2)
+    parser.add_argument("--C", type=float, default=1.0, help="Inverse regularisation strength")
+    args = parser.parse_args()
+
+    texts, labels, rows = read_dataset(args.data, args.text_column, args.label_column)
+    if not texts:
+        raise SystemExit(f"No rows with a '{args.text_column}' column found in {args.data}")
+    if not args.distill:
+        levels = parse_levels(labels, rows, args.data, args.label_column)
+
+    from sentence_transformers import SentenceTransformer
+    embedder = SentenceTransformer('all-mpnet-base-v2')
+    embeddings = embedder.encode(texts, batch_size=64, show_progress_bar=True)
+
+    if args.distill:
+        levels = load_classifier("rf").predict(embeddings)
+
+    seen_levels, counts = np.unique(levels, return_counts=True)
+    rare_levels = seen_levels[counts < 2].tolist()
+    if rare_levels:
+        raise SystemExit(f"Bloom levels {rare_levels} have fewer than 2 rows; add more examples to split them")
+
+    indices = np.arange(len(texts))
+    try:
+        train_idx, test_idx = train_test_split(
+            indices, test_size=args.test_size, random_state=42, stratify=levels
+        )
+    except ValueError as e:
+        raise SystemExit(f"Could not make a stratified split: {e}")
+    model = LogisticRegression(C=args.C, max_iter=2000)
+    model.fit(embeddings[train_idx], levels[train_idx])
+
+    head = LinearBloomHead(model.coef_, model.intercept_, model.classes_)
+    missing_levels = sorted(set(seen_levels.tolist()) - set(head.classes_.tolist()))
+    if missing_levels:
+        print(f"Warning: the head cannot predict Bloom levels {missing_levels} seen in the data")
+    unknown_levels = sorted(set(head.classes_.tolist()) - set(BLOOM_LEVELS))
+    if unknown_levels:
+        raise SystemExit(f"Refusing to export a head with classes {unknown_levels} outside Bloom levels {list(BLOOM_LEVELS)}")
+    accuracy = float(np.mean(head.predict(embeddings[test_idx]) == levels[test_idx]))
+    metric = "agreement with random forest" if args.distill else "accuracy"
+    print(f"Held-out {metric}: {accuracy:.4f} ({len(test_idx)} samples)")
+
+    head.save(args.output)
+    print(f"Saved linear Bloom head to {args.output}")
+
+    holdout_path = args.holdout_output
+    if holdout_path is None:
+        holdout_path = f"{os.path.splitext(args.data)[0]}_holdout.csv"
+    write_holdout(holdout_path, [texts[i] for i in test_idx], levels[test_idx], args.label_column)
+    print(f"Saved held-out split to {holdout_path}")
+    benchmark_command = (
+        f"python benchmark_bloom.py --data {holdout_path} "
+        f"--label-column {args.label_column} --linear-model {args.output}"
+    )
+    if args.distill:
+        benchmark_command += " --distilled"
+    print(f"Benchmark with: {benchmark_command}")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,7 +13,11 @@ from dotenv import load_dotenv
 import os
 
 # Import your BloomPredictor
-from bloom_predictor import predict_bloom_level_for_paragraph
+from bloom_predictor import (
+    get_bloom_predictor,
+    predict_bloom_level_for_paragraph,
+    predict_bloom_probabilities_for_paragraph,
+)
 
 # Configure logging
 logging.basicConfig(
@@ -432,11 +436,14 @@ async def upload_pdf(file: UploadFile):
                 
                 # Use your BloomPredictor
                 try:
-                    bloom_level = predict_bloom_level_for_paragraph(content_text)
-                    logger.info(f"Predicted Bloom level {bloom_level} for {subtopic}")
+                    probabilities = predict_bloom_probabilities_for_paragraph(content_text)
+                    bloom_level = max(probabilities, key=probabilities.get)
+                    bloom_confidence = probabilities[bloom_level]
+                    logger.info(f"Predicted Bloom level {bloom_level} ({bloom_confidence:.2f}) for {subtopic}")
                 except Exception as e:
                     logger.error(f"Error predicting Bloom level: {e}")
                     bloom_level = 2
+                    bloom_confidence = None
                 
                 try:
                     questions = generate_questions_with_groq(content_text, bloom_level)
@@ -447,6 +454,7 @@ async def upload_pdf(file: UploadFile):
                             "type": q["type"],
                             "bloomLevel": bloom_level,
                             "bloomName": BLOOM_TAXONOMY[bloom_level]["name"],
+                            "bloomConfidence": bloom_confidence,
                             "mainTopic": main_topic,
                             "subtopic": subtopic,
                             "options": q.get("options", []),
@@ -504,12 +512,14 @@ async def startup_event():
     except Exception as e:
         logger.warning(f"GROQ API test failed: {e}")
 
-    # Test BloomPredictor
+    # Load BloomPredictor; a missing or misconfigured model must stop the service
     try:
+        predictor = get_bloom_predictor()
         test_result = predict_bloom_level_for_paragraph("Define artificial intelligence.")
-        logger.info(f"BloomPredictor test successful, result: {test_result}")
+        logger.info(f"BloomPredictor ({predictor.backend}) test successful, result: {test_result}")
     except Exception as e:
-        logger.error(f"BloomPredictor test failed: {e}")
+        logger.error(f"BloomPredictor failed to load: {e}")
+        raise
 
 from fastapi import Body
 from sklearn.feature_extraction.text import TfidfVectorizer
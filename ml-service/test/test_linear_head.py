@@ -0,0 +1,76 @@
+import os
+import sys
+import types
+
+import numpy as np
+import pytest
+from sklearn.linear_model import LogisticRegression
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bloom_predictor import BloomPredictor, LinearBloomHead, load_classifier
+from export_bloom_head import parse_levels
+
+
+@pytest.mark.parametrize("n_classes", [2, 6])
+def test_linear_head_matches_sklearn(tmp_path, n_classes):
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(300, 16)).astype(np.float32)
+    y = rng.integers(1, n_classes + 1, size=300)
+    model = LogisticRegression(max_iter=1000).fit(X, y)
+
+    head = LinearBloomHead(model.coef_, model.intercept_, model.classes_)
+    np.testing.assert_allclose(head.predict_proba(X), model.predict_proba(X), atol=1e-5)
+    np.testing.assert_array_equal(head.predict(X), model.predict(X))
+
+    path = tmp_path / "head"
+    head.save(path)
+    assert path.exists()
+    loaded = LinearBloomHead.load(path)
+    np.testing.assert_array_equal(loaded.classes_, head.classes_)
+    np.testing.assert_array_equal(loaded.predict_proba(X), head.predict_proba(X))
+
+
+class StubEmbedder:
+    def __init__(self, model_name):
+        self.model_name = model_name
+
+    def encode(self, paragraphs):
+        rng = np.random.default_rng(len(paragraphs))
+        return rng.normal(size=(len(paragraphs), 16)).astype(np.float32)
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError, match="expected one of rf, linear"):
+        load_classifier("forest")
+    with pytest.raises(ValueError, match="expected one of rf, linear"):
+        BloomPredictor(backend="forest")
+
+
+def test_predict_bloom_probabilities(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "sentence_transformers", types.SimpleNamespace(SentenceTransformer=StubEmbedder))
+    rng = np.random.default_rng(1)
+    head = LinearBloomHead(rng.normal(size=(6, 16)), rng.normal(size=6), np.arange(1, 7))
+    path = tmp_path / "bloom_linear.npz"
+    head.save(path)
+
+    predictor = BloomPredictor(model_path=path, backend="linear")
+    paragraphs = ["Define a neuron.", "Compare two sorting algorithms.", "Design a compiler."]
+    probabilities = predictor.predict_bloom_probabilities(paragraphs)
+
+    assert len(probabilities) == len(paragraphs)
+    for row in probabilities:
+        assert list(row) == [1, 2, 3, 4, 5, 6]
+        assert sum(row.values()) == pytest.approx(1.0)
+    assert predictor.predict_bloom_levels(paragraphs) == [max(row, key=row.get) for row in probabilities]
+    assert predictor.predict_bloom_probabilities([]) == []
+
+
+@pytest.mark.parametrize("label", ["Apply", "3.5", "", "0", "7", "-1"])
+def test_parse_levels_rejects_bad_labels(label):
+    with pytest.raises(SystemExit, match=r"data\.csv:3: 'level' must be an integer Bloom level"):
+        parse_levels(["2", label], [2, 3], "data.csv", "level")
+
+
+def test_parse_levels_accepts_integer_levels():
+    np.testing.assert_array_equal(parse_levels(["1", "3.0", "6"], [2, 3, 4], "data.csv", "level"), [1, 3, 6])